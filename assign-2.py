@@ -1,105 +1,251 @@
 import numpy as np
 import pandas as pd
-from flask import Flask, render_template_string, jsonify, request
-import plotly
-import plotly.express as px
-import plotly.graph_objects as go
-import json
-from datetime import datetime, timedelta
-from sklearn.cluster import KMeans
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
-import statsmodels.api as sm
+from flask import Flask, abort, request
+from flask_compress import Compress
+import orjson
+import hashlib
+from datetime import date, timedelta
 from jinja2 import Template
 import os
+import threading
+import time
+from functools import lru_cache, wraps
+from cachetools import TLRUCache, TTLCache, cached
+
+# Lets the unfiltered real-data path return the cached frame without a defensive copy;
+# mask-filtered frames are still copies
+pd.options.mode.copy_on_write = True
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24).hex()
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
 
 # -------------------- Data Loading (real Kaggle dataset if available) --------------------
 DATA_FILE = 'agriculture.csv'
 
-def load_real_data():
+REQUIRED_COLUMNS = ['date', 'temperature', 'humidity', 'soil_moisture', 'rainfall',
+                    'crop_yield', 'field', 'crop_type', 'ndvi', 'pest_risk',
+                    'disease_risk', 'water_stress', 'equipment_hours', 'co2_emission']
+CSV_DTYPES = {
+    'temperature': 'float32', 'humidity': 'float32', 'soil_moisture': 'float32',
+    'rainfall': 'float32', 'crop_yield': 'float32', 'ndvi': 'float32',
+    'pest_risk': 'float32', 'disease_risk': 'float32', 'water_stress': 'float32',
+    'co2_emission': 'float32', 'equipment_hours': 'float32',
+    'field': 'category', 'crop_type': 'category'
+}
+CSV_CHUNKSIZE = 200_000
+
+def read_real_data():
     if os.path.exists(DATA_FILE):
         try:
-            df = pd.read_csv(DATA_FILE)
+            # Stream only the columns we use, with compact dtypes, so memory stays bounded
+            chunks = pd.read_csv(DATA_FILE, usecols=lambda col: col in REQUIRED_COLUMNS or col == 'farm',
+                                 dtype=CSV_DTYPES, parse_dates=['date'], chunksize=CSV_CHUNKSIZE)
+            df = pd.concat(chunks, ignore_index=True)
             # Ensure required columns exist, otherwise generate
-            required = ['date', 'temperature', 'humidity', 'soil_moisture', 'rainfall',
-                        'crop_yield', 'field', 'crop_type', 'ndvi', 'pest_risk',
-                        'disease_risk', 'water_stress', 'equipment_hours', 'co2_emission']
-            if all(col in df.columns for col in required):
+            missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+            if not missing:
+                # Chunks with different category sets concatenate back to object
+                df['field'] = df['field'].astype('category')
+                df['crop_type'] = df['crop_type'].astype('category')
+                # Hours are read as float so blanks parse; narrow to the smallest int that fits when complete
+                hours = df['equipment_hours']
+                if hours.notna().all() and (hours == hours.round()).all():
+                    df['equipment_hours'] = pd.to_numeric(hours, downcast='integer')
                 return df
-        except:
-            pass
+            app.logger.error("%s is missing columns %s; using synthetic data", DATA_FILE, missing)
+        except (ValueError, TypeError, OSError) as exc:
+            app.logger.error("Could not load %s (%s); using synthetic data", DATA_FILE, exc)
     return None
 
-REAL_DATA_AVAILABLE = load_real_data() is not None
+# The CSV is parsed once at import; call reload_data() after replacing the file.
+_RAW_DF = read_real_data()
+_DATA_VERSION = 0
+
+def load_real_data():
+    return _RAW_DF
+
+def reload_data():
+    global _RAW_DF, _DATA_VERSION
+    _RAW_DF = read_real_data()
+    _DATA_VERSION += 1
+
+REAL_DATA_AVAILABLE = _RAW_DF is not None
 
 def generate_sample_data(farm=None, start_date=None, end_date=None, crops=None):
+    # Frames are shared between callers through the cache, so treat them as read-only
+    crops = frozenset(crops) if crops else None
+    return _generate_sample_data(_DATA_VERSION, farm, start_date, end_date, crops)
+
+@lru_cache(maxsize=128)
+def _generate_sample_data(version, farm, start_date, end_date, crops):
     real_df = load_real_data()
     if real_df is not None:
-        df = real_df.copy()
+        df = real_df
         if crops:
-            df = df[df['crop_type'].isin(crops)]
+            df = df.loc[df['crop_type'].isin(crops)]
         if farm and 'farm' in df.columns:
-            df = df[df['farm'] == farm]
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
+            df = df.loc[df['farm'] == farm]
         return df
     else:
-        np.random.seed(42 + hash(farm) % 100 if farm else 42)
         dates = pd.date_range(start='2024-01-01', end='2024-03-31', freq='D')
-        n = len(dates)
-        df = pd.DataFrame({
-            'date': dates,
-            'temperature': np.random.normal(25, 5, n),
-            'humidity': np.random.normal(65, 10, n),
-            'soil_moisture': np.random.normal(70, 15, n),
-            'rainfall': np.random.exponential(5, n),
-            'crop_yield': np.random.normal(1200, 200, n),
-            'field': np.random.choice(['Field A', 'Field B', 'Field C', 'Field D'], n),
-            'crop_type': np.random.choice(['Corn', 'Wheat', 'Soybeans'], n),
-            'ndvi': np.random.uniform(0.5, 0.9, n),
-            'pest_risk': np.random.uniform(0, 1, n),
-            'disease_risk': np.random.uniform(0, 1, n),
-            'water_stress': np.random.uniform(0, 1, n),
-            'equipment_hours': np.random.randint(0, 500, n),
-            'co2_emission': np.random.uniform(10, 50, n)
-        })
+        rng = np.random.default_rng(FARM_SEEDS.get(farm, 42))
+        values, codes = _sample_block(len(dates), rng)
+        df = pd.DataFrame(values, columns=SAMPLE_COLUMNS)
+        df['equipment_hours'] = df['equipment_hours'].astype(np.int16)
+        df.insert(0, 'date', dates)
+        df.insert(6, 'field', pd.Categorical.from_codes(codes[:, 0], categories=SAMPLE_FIELDS))
+        df.insert(7, 'crop_type', pd.Categorical.from_codes(codes[:, 1], categories=SAMPLE_CROPS))
         if crops:
             df = df[df['crop_type'].isin(crops)]
         return df
 
+FARMS = ['Green Valley Farm', 'Sunrise Fields', 'Mountain View Ranch']
+FARM_SEEDS = {name: 42 + (hash(name) & 0xff) for name in FARMS}
+SAMPLE_FIELDS = ['Field A', 'Field B', 'Field C', 'Field D']
+SAMPLE_CROPS = ['Corn', 'Wheat', 'Soybeans']
+SAMPLE_COLUMNS = ['temperature', 'humidity', 'soil_moisture', 'rainfall', 'crop_yield', 'ndvi',
+                  'pest_risk', 'disease_risk', 'water_stress', 'equipment_hours', 'co2_emission']
+
+def _sample_block(n, rng):
+    # One vectorized draw per column, filling SAMPLE_COLUMNS plus the field/crop codes
+    values = np.empty((n, 11), np.float32)
+    values[:, 0] = rng.normal(25, 5, n)
+    values[:, 1] = rng.normal(65, 10, n)
+    values[:, 2] = rng.normal(70, 15, n)
+    values[:, 3] = rng.exponential(5, n)
+    values[:, 4] = rng.normal(1200, 200, n)
+    values[:, 5] = rng.uniform(0.5, 0.9, n)
+    values[:, 6:9] = rng.uniform(0, 1, (n, 3))
+    values[:, 9] = rng.integers(0, 500, n)
+    values[:, 10] = rng.uniform(10, 50, n)
+    codes = np.empty((n, 2), np.int8)
+    codes[:, 0] = rng.integers(0, 4, n)
+    codes[:, 1] = rng.integers(0, 3, n)
+    return values, codes
+
+def sample_columns(farm=None, start_date=None, end_date=None, crops=None):
+    # Struct-of-arrays view of generate_sample_data, for helpers that only reduce columns
+    crops = frozenset(crops) if crops else None
+    return _sample_columns(_DATA_VERSION, farm, start_date, end_date, crops)
+
+@lru_cache(maxsize=128)
+def _sample_columns(version, farm, start_date, end_date, crops):
+    df = _generate_sample_data(version, farm, start_date, end_date, crops)
+    cols = {name: df[name].to_numpy() for name in SAMPLE_COLUMNS}
+    # Group rows by field once: a stable sort of the codes plus the start offset of each run.
+    # Rows with no field (code -1) are left out, as groupby drops them.
+    codes = df['field'].cat.codes.to_numpy()
+    keep = np.flatnonzero(codes >= 0)
+    order = keep[np.argsort(codes[keep], kind='stable')]
+    codes_s = codes[order]
+    edges = np.flatnonzero(np.diff(codes_s)) + 1
+    edges = np.concatenate(([0], edges)) if len(codes_s) else edges
+    cols['field_order'] = order
+    cols['field_edges'] = edges
+    cols['field_names'] = df['field'].cat.categories.to_numpy()[codes_s[edges]]
+    return cols
+
 # -------------------- Helper Functions --------------------
+# Shared generator for the simulated live readings; draws are batched per request
+_RNG = np.random.default_rng()
+
 def get_kpi_data(filters=None):
-    df = generate_sample_data(**filters) if filters else generate_sample_data()
+    cols = sample_columns(**filters) if filters else sample_columns()
     return {
-        'total_yield': f"{df['crop_yield'].sum():,.0f} kg",
-        'avg_temp': f"{df['temperature'].mean():.1f} °C",
-        'avg_soil_moisture': f"{df['soil_moisture'].mean():.0f}%",
-        'total_rainfall': f"{df['rainfall'].sum():,.0f} mm",
-        'co2_footprint': f"{df['co2_emission'].mean():.1f} kg/ha"
+        'total_yield': f"{np.nansum(cols['crop_yield'], dtype=np.float64):,.0f} kg",
+        'avg_temp': f"{np.nanmean(cols['temperature'], dtype=np.float64):.1f} °C",
+        'avg_soil_moisture': f"{np.nanmean(cols['soil_moisture'], dtype=np.float64):.0f}%",
+        'total_rainfall': f"{np.nansum(cols['rainfall'], dtype=np.float64):,.0f} mm",
+        'co2_footprint': f"{np.nanmean(cols['co2_emission'], dtype=np.float64):.1f} kg/ha"
     }
 
+def field_means(cols, features, out=None):
+    # Per-field means: add.reduceat per feature over the pre-sorted rows, into `out` when it fits.
+    # NaNs are skipped like groupby().mean(); a field with no values for a feature gets NaN.
+    order, edges = cols['field_order'], cols['field_edges']
+    if out is None or out.shape != (len(edges), len(features)):
+        out = np.empty((len(edges), len(features)))
+    if len(edges):
+        for j, f in enumerate(features):
+            values = cols[f][order]
+            counts = np.add.reduceat(~np.isnan(values), edges, dtype=np.intp)
+            with np.errstate(invalid='ignore'):
+                out[:, j] = np.add.reduceat(np.nan_to_num(values), edges, dtype=np.float64) / counts
+    return cols['field_names'], out
+
+ANOMALY_FEATURES = ['temperature', 'humidity', 'soil_moisture', 'crop_yield', 'equipment_hours']
+
+# The forest is fitted once and reused; polls only walk the trees until it goes stale
+ANOMALY_REFIT_SECONDS = 600
+_iforest = None
+_iforest_fitted_at = 0.0
+_iforest_lock = threading.Lock()
+
+def anomaly_model(features):
+    global _iforest, _iforest_fitted_at
+    # Deferred so workers that never score anomalies don't pay for importing sklearn
+    from sklearn.ensemble import IsolationForest
+    with _iforest_lock:
+        if _iforest is None or time.monotonic() - _iforest_fitted_at > ANOMALY_REFIT_SECONDS:
+            _iforest = IsolationForest(contamination=0.2, random_state=42, n_jobs=-1).fit(features)
+            _iforest_fitted_at = time.monotonic()
+        return _iforest
+
+# Feature matrix reused by every anomaly check (one row per field)
+_feature_buf = np.empty((len(SAMPLE_FIELDS), len(ANOMALY_FEATURES)), dtype=np.float32)
+_feature_lock = threading.Lock()
+
+# /api/anomalies is polled every minute; serve repeat polls from a short-lived cache
+_anomaly_cache = TTLCache(maxsize=32, ttl=30)
+
+@cached(_anomaly_cache, lock=threading.Lock())
 def detect_anomalies():
-    df = generate_sample_data().groupby('field').agg({
-        'temperature': 'mean',
-        'humidity': 'mean',
-        'soil_moisture': 'mean',
-        'crop_yield': 'mean',
-        'equipment_hours': 'mean'
-    }).reset_index()
-    features = df[['temperature', 'humidity', 'soil_moisture', 'crop_yield', 'equipment_hours']]
-    iso_forest = IsolationForest(contamination=0.2, random_state=42)
-    df['anomaly'] = iso_forest.fit_predict(features)
-    anomalies = df[df['anomaly'] == -1]['field'].tolist()
-    return anomalies
-
-def forecast_yield(days=30):
-    df = generate_sample_data().set_index('date')['crop_yield']
-    model = sm.tsa.ARIMA(df, order=(1,1,1)).fit()
-    forecast = model.forecast(steps=days)
-    return forecast.tolist()
+    with _feature_lock:
+        fields, features = field_means(sample_columns(), ANOMALY_FEATURES, out=_feature_buf)
+        mask = anomaly_model(features).predict(features) == -1
+    return fields[mask].tolist()
+
+@lru_cache(maxsize=2)
+def _fit_arima(version):
+    # Fitted on the full yield column, so the data version is the whole key; reload_data() refits
+    from statsforecast import StatsForecast
+    from statsforecast.models import ARIMA
+    y = _sample_columns(version, None, None, None, None)['crop_yield'].astype(np.float64)
+    sf = StatsForecast(models=[ARIMA(order=(1,1,1))], freq=1, n_jobs=1)
+    return sf.fit(pd.DataFrame({'unique_id': 'yield', 'ds': np.arange(len(y)), 'y': y}))
+
+FORECAST_DAYS = 30
+
+@lru_cache(maxsize=4)
+def _base_forecast(version, days):
+    # Shared by the forecasting page and every /api/forecast-data page; read-only
+    model = _fit_arima(version)
+    forecast = model.predict(h=days)['ARIMA'].to_numpy(dtype=np.float64)
+    forecast.flags.writeable = False
+    return forecast
+
+def forecast_yield(days=FORECAST_DAYS):
+    return _base_forecast(_DATA_VERSION, days).tolist()
+
+@lru_cache(maxsize=64)
+def forecast_day_labels(page):
+    start = (page - 1) * FORECAST_DAYS
+    return ['Day ' + str(start + i + 1) for i in range(FORECAST_DAYS)]
+
+YIELD_RESAMPLE_FREQ = 'W'
+
+def yield_series(df):
+    # Bare x/y arrays per field; plotYield() in static/app.js turns them into the figure
+    # Yield is averaged per week first so the payload stays bounded as the dataset grows
+    weekly = df.groupby(['field', pd.Grouper(key='date', freq=YIELD_RESAMPLE_FREQ)], observed=True)['crop_yield'].mean()
+    traces = [{'name': field,
+               'x': group.index.get_level_values('date').strftime('%Y-%m-%d').tolist(),
+               'y': group.astype(np.float64).round(3).tolist()}
+              for field, group in weekly.groupby(level='field', sort=False, observed=True)]
+    return {'traces': traces}
 
 def get_ai_recommendation():
     anomalies = detect_anomalies()
@@ -110,7 +256,7 @@ def get_ai_recommendation():
 
 def predict_maintenance():
     fields = ['Field A', 'Field B', 'Field C', 'Field D']
-    hours = [np.random.randint(200, 500) for _ in fields]
+    hours = _RNG.integers(200, 500, len(fields)).tolist()
     maintenance = ['Due soon' if h > 400 else 'OK' for h in hours]
     return dict(zip(fields, zip(hours, maintenance)))
 
@@ -125,14 +271,32 @@ LOGO_SVG = '''
 </svg>
 '''
 
+# -------------------- Static Assets --------------------
+# Content hashes for the shared CSS/JS; the query string changes whenever a file does
+STATIC_ASSETS = ['app.css', 'app.js']
+ASSET_VERSIONS = {}
+for _name in STATIC_ASSETS:
+    with open(os.path.join(app.static_folder, _name), 'rb') as _f:
+        ASSET_VERSIONS[_name] = hashlib.blake2b(_f.read(), digest_size=8).hexdigest()
+
+@app.after_request
+def cache_static_assets(response):
+    # Versioned URLs never change content, so browsers may keep them for a year
+    if request.path.startswith('/static/') and request.args.get('v'):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 # -------------------- Context Processor --------------------
+_STATIC_GLOBALS = {
+    'timedelta': timedelta,
+    'logo_svg': LOGO_SVG,
+    'asset_versions': ASSET_VERSIONS
+}
+
 @app.context_processor
 def inject_globals():
-    return {
-        'now': datetime.now(),
-        'timedelta': timedelta,
-        'logo_svg': LOGO_SVG
-    }
+    # Templates only format the date, so `now` is day-resolution to match the page cache
+    return {**_STATIC_GLOBALS, 'now': date.today()}
 
 # -------------------- Base Template --------------------
 BASE_TEMPLATE = '''
@@ -144,209 +308,8 @@ BASE_TEMPLATE = '''
     <title>Smart Agriculture</title>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: 'Inter', sans-serif;
-            background: #f5f9f5;
-            color: #1e2e1e;
-            transition: background 0.3s;
-        }
-        body.dark-mode {
-            background: #1e2e1e;
-            color: #f5f9f5;
-        }
-        .app-container { display: flex; min-height: 100vh; }
-        .sidebar {
-            width: 280px;
-            background: linear-gradient(180deg, #005B31 0%, #01B763 100%);
-            padding: 1.5rem;
-            display: flex;
-            flex-direction: column;
-            gap: 1.5rem;
-            box-shadow: 4px 0 20px rgba(0,60,0,0.3);
-            animation: slideInLeft 0.5s ease;
-            color: white;
-        }
-        @keyframes slideInLeft {
-            from { transform: translateX(-100%); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-        .logo svg { filter: drop-shadow(0 4px 6px rgba(0,40,0,0.5)); }
-        .profile-card {
-            background: rgba(255,255,255,0.1);
-            border-radius: 20px;
-            padding: 1rem;
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-            backdrop-filter: blur(5px);
-            border: 1px solid rgba(255,255,255,0.2);
-            transition: transform 0.2s;
-        }
-        .profile-card:hover { transform: scale(1.02); box-shadow: 0 8px 20px rgba(0,80,0,0.3); }
-        .avatar {
-            width: 50px; height: 50px;
-            background: linear-gradient(135deg, #01B763, #005B31);
-            border-radius: 50%;
-            display: flex; align-items: center; justify-content: center;
-            font-size: 1.5rem; box-shadow: 0 4px 10px rgba(0,80,0,0.4);
-        }
-        .profile-info .name { font-weight: 600; font-size: 1.1rem; }
-        .profile-info .role { font-size: 0.85rem; opacity: 0.7; }
-        .nav-menu { display: flex; flex-direction: column; gap: 0.5rem; }
-        .nav-item {
-            display: flex; align-items: center; gap: 0.75rem;
-            padding: 0.75rem 1rem; border-radius: 12px;
-            color: white; text-decoration: none;
-            transition: all 0.2s; border: 1px solid transparent;
-            font-weight: 500;
-        }
-        .nav-item:hover {
-            background: rgba(255,255,255,0.15);
-            transform: translateX(5px);
-            border-color: rgba(255,255,255,0.2);
-        }
-        .nav-item.active {
-            background: white;
-            color: #005B31;
-            border: none; box-shadow: 0 4px 15px rgba(255,255,255,0.3);
-        }
-        .filters {
-            background: rgba(255,255,255,0.05);
-            border-radius: 16px; padding: 1rem;
-            border: 1px solid rgba(255,255,255,0.1);
-        }
-        .filters h4 { margin-bottom: 1rem; opacity: 0.8; font-weight: 500; }
-        .filter-select, .date-input {
-            width: 100%; padding: 0.6rem; border-radius: 10px;
-            border: 1px solid rgba(255,255,255,0.3);
-            background: rgba(0,0,0,0.1); color: white;
-            margin-bottom: 0.5rem; transition: all 0.2s;
-        }
-        .filter-select:hover, .date-input:hover { border-color: #01B763; }
-        .date-range { display: flex; gap: 0.5rem; align-items: center; margin: 0.5rem 0; }
-        .crop-chips { display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem; }
-        .chip {
-            background: rgba(255,255,255,0.1); padding: 0.3rem 1rem;
-            border-radius: 30px; font-size: 0.85rem; cursor: pointer;
-            transition: all 0.2s; border: 1px solid transparent;
-        }
-        .chip:hover { background: rgba(1,183,99,0.4); transform: translateY(-2px); }
-        .chip.selected { background: #01B763; color: #005B31; font-weight: 600; box-shadow: 0 4px 10px rgba(1,183,99,0.4); }
-        .refresh-btn {
-            background: linear-gradient(90deg, #01B763, #005B31);
-            border: none; padding: 0.75rem; border-radius: 12px;
-            color: white; font-weight: 600; cursor: pointer;
-            transition: all 0.2s; animation: pulseGreen 2s infinite;
-            box-shadow: 0 4px 15px rgba(1,183,99,0.3);
-        }
-        .refresh-btn:hover { transform: scale(1.02); box-shadow: 0 6px 20px rgba(1,183,99,0.5); }
-        @keyframes pulseGreen {
-            0% { box-shadow: 0 0 0 0 rgba(1,183,99,0.7); }
-            70% { box-shadow: 0 0 0 10px rgba(1,183,99,0); }
-            100% { box-shadow: 0 0 0 0 rgba(1,183,99,0); }
-        }
-        .update-time { text-align: center; font-size: 0.8rem; opacity: 0.6; margin-top: 0.5rem; }
-        .main-content {
-            flex: 1; padding: 2rem; overflow-y: auto;
-            animation: fadeIn 0.5s ease;
-        }
-        @keyframes fadeIn { from { opacity: 0; } to { opacity: 1; } }
-        .theme-toggle {
-            position: fixed; bottom: 20px; right: 20px;
-            background: rgba(255,255,255,0.2); backdrop-filter: blur(10px);
-            width: 50px; height: 50px; border-radius: 50%;
-            display: flex; align-items: center; justify-content: center;
-            cursor: pointer; border: 1px solid rgba(255,255,255,0.3);
-            z-index: 1000; transition: all 0.3s;
-            color: white;
-        }
-        .theme-toggle:hover { transform: rotate(15deg) scale(1.1); background: #01B763; }
-        .spinner {
-            border: 4px solid rgba(1,183,99,0.2); border-top: 4px solid #01B763;
-            border-radius: 50%; width: 40px; height: 40px;
-            animation: spin 1s linear infinite; margin: 20px auto;
-        }
-        @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-        .grid-2 { display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; margin-bottom: 1.5rem; }
-        .grid-3 { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1.5rem; margin-bottom: 1.5rem; }
-        .grid-4 { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1.5rem; margin-bottom: 1.5rem; }
-        .card {
-            background: white; border-radius: 24px; padding: 1.5rem;
-            border: 1px solid #c8e6c9; box-shadow: 0 10px 30px -10px rgba(0,80,0,0.1);
-            transition: all 0.3s; animation: cardAppear 0.5s ease backwards;
-        }
-        body.dark-mode .card { background: #2e3b2e; border-color: #01B763; }
-        .card:hover { transform: translateY(-5px); border-color: #01B763; box-shadow: 0 15px 30px rgba(1,183,99,0.15); }
-        .card h3 { color: #005B31; margin-bottom: 1rem; font-weight: 600; }
-        body.dark-mode .card h3 { color: #01B763; }
-        .kpi-value { font-size: 2rem; font-weight: 700; color: #005B31; }
-        body.dark-mode .kpi-value { color: #01B763; }
-        .trend {
-            font-size: 0.85rem; padding: 0.25rem 0.75rem; border-radius: 30px;
-            display: inline-block;
-        }
-        .trend.up { background: #e8f5e9; color: #005B31; }
-        .trend.down { background: #ffebee; color: #E74C3C; }
-        .welcome-header {
-            display: flex; justify-content: space-between; align-items: center;
-            margin-bottom: 2rem;
-        }
-        .welcome-header h1 { font-size: 2rem; color: #005B31; }
-        .date-badge {
-            background: #01B763; color: white; padding: 0.5rem 1rem;
-            border-radius: 30px; font-weight: 500;
-        }
-        .weather-card {
-            display: flex; gap: 2rem; align-items: center;
-        }
-        .weather-item { text-align: center; }
-        .weather-item .value { font-size: 1.8rem; font-weight: 700; color: #005B31; }
-        .weather-item .label { color: #4a6b5a; }
-        .soil-moisture-stats { display: flex; justify-content: space-around; }
-        .stat-number { font-size: 1.8rem; font-weight: 700; color: #01B763; }
-        .growth-timeline {
-            display: flex; gap: 1rem; justify-content: space-between;
-        }
-        .stage {
-            background: #e8f5e9; padding: 1rem; border-radius: 12px; flex: 1;
-            text-align: center;
-        }
-        .stage .phase { font-weight: 600; color: #005B31; }
-        .stage .week { color: #01B763; }
-        .water-level {
-            display: flex; gap: 0.5rem; flex-wrap: wrap;
-        }
-        .water-tag {
-            background: #e8f5e9; padding: 0.5rem 1rem; border-radius: 30px;
-            color: #005B31; font-weight: 500;
-        }
-        .harvest-item {
-            display: flex; justify-content: space-between;
-            padding: 0.75rem 0; border-bottom: 1px solid #c8e6c9;
-        }
-        .harvest-item:last-child { border-bottom: none; }
-        .btn {
-            padding: 0.5rem 1.5rem; border-radius: 30px; border: none;
-            font-weight: 600; cursor: pointer; transition: all 0.2s;
-        }
-        .btn-primary { background: #01B763; color: white; }
-        .btn-primary:hover { background: #005B31; transform: scale(1.05); }
-        .btn-secondary { background: #E74C3C; color: white; }
-        .btn-secondary:hover { background: #c0392b; }
-        .analytics-desc {
-            background: #e8f5e9; padding: 1rem; border-radius: 12px;
-            margin-bottom: 1.5rem; color: #005B31;
-        }
-        @media (max-width: 1024px) {
-            .grid-4 { grid-template-columns: repeat(2, 1fr); }
-            .grid-3 { grid-template-columns: repeat(2, 1fr); }
-        }
-        @media (max-width: 768px) {
-            .grid-2, .grid-3, .grid-4 { grid-template-columns: 1fr; }
-        }
-    </style>
+    <link rel="stylesheet" href="{{ url_for('static', filename='app.css', v=asset_versions['app.css']) }}">
+    <script src="{{ url_for('static', filename='app.js', v=asset_versions['app.js']) }}" defer></script>
 </head>
 <body>
     <div class="app-container">
@@ -391,7 +354,7 @@ BASE_TEMPLATE = '''
                 </div>
             </div>
             <button id="refresh-btn" class="refresh-btn">🔄 Refresh Data</button>
-            <div class="update-time">Last update: <span id="last-update">{{ now.strftime('%H:%M:%S') }}</span></div>
+            <div class="update-time">Last update: <span id="last-update"></span></div>
         </aside>
         <main class="main-content" id="main-content">
             {{ page_content | safe }}
@@ -399,111 +362,6 @@ BASE_TEMPLATE = '''
     </div>
     <div class="theme-toggle" id="theme-toggle">🌓</div>
     <div id="notification-area"></div>
-
-    <script>
-        let selectedCrops = ['Corn', 'Wheat'];
-        document.querySelectorAll('.chip').forEach(chip => {
-            const crop = chip.dataset.crop;
-            if (selectedCrops.includes(crop)) chip.classList.add('selected');
-            chip.addEventListener('click', function() {
-                const crop = this.dataset.crop;
-                if (selectedCrops.includes(crop)) {
-                    selectedCrops = selectedCrops.filter(c => c !== crop);
-                    this.classList.remove('selected');
-                } else {
-                    selectedCrops.push(crop);
-                    this.classList.add('selected');
-                }
-                if (window.refreshPageData) window.refreshPageData();
-            });
-        });
-
-        document.getElementById('refresh-btn').addEventListener('click', function() {
-            showSpinner();
-            if (window.refreshPageData) window.refreshPageData();
-            document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
-            hideSpinner();
-        });
-
-        document.getElementById('farm-select').addEventListener('change', function() {
-            if (window.refreshPageData) window.refreshPageData();
-        });
-        document.getElementById('start-date').addEventListener('change', function() {
-            if (window.refreshPageData) window.refreshPageData();
-        });
-        document.getElementById('end-date').addEventListener('change', function() {
-            if (window.refreshPageData) window.refreshPageData();
-        });
-
-        function showSpinner() {
-            let spinner = document.getElementById('global-spinner');
-            if (!spinner) {
-                spinner = document.createElement('div');
-                spinner.id = 'global-spinner';
-                spinner.className = 'spinner';
-                spinner.style.position = 'fixed';
-                spinner.style.top = '50%';
-                spinner.style.left = '50%';
-                spinner.style.transform = 'translate(-50%, -50%)';
-                spinner.style.zIndex = '3000';
-                document.body.appendChild(spinner);
-            }
-        }
-        function hideSpinner() {
-            const spinner = document.getElementById('global-spinner');
-            if (spinner) spinner.remove();
-        }
-
-        function showNotification(message, type = 'info') {
-            const area = document.getElementById('notification-area');
-            const notif = document.createElement('div');
-            notif.className = 'notification';
-            notif.style.borderLeftColor = type === 'error' ? '#E74C3C' : '#01B763';
-            notif.innerHTML = message;
-            area.appendChild(notif);
-            setTimeout(() => notif.remove(), 5000);
-        }
-
-        function updateSensors() {
-            fetch('/api/sensor-data')
-                .then(res => res.json())
-                .then(data => {
-                    document.querySelectorAll('.sensor-value').forEach(el => {
-                        const sensor = el.dataset.sensor;
-                        if (data[sensor] !== undefined) {
-                            let unit = '';
-                            if (sensor === 'temperature') unit = '°C';
-                            else if (sensor === 'humidity') unit = '%';
-                            else if (sensor === 'light') unit = ' lux';
-                            else unit = '%';
-                            el.textContent = data[sensor] + unit;
-                            const progress = el.closest('.sensor-item')?.querySelector('.progress');
-                            if (progress) {
-                                let percent = data[sensor];
-                                if (sensor === 'temperature') percent = (data[sensor] / 50) * 100;
-                                if (sensor === 'light') percent = (data[sensor] / 1000) * 100;
-                                progress.style.width = Math.min(percent, 100) + '%';
-                            }
-                        }
-                    });
-                });
-        }
-        setInterval(updateSensors, 30000);
-
-        setInterval(() => {
-            fetch('/api/anomalies')
-                .then(res => res.json())
-                .then(data => {
-                    if (data.anomalies.length > 0) {
-                        showNotification('⚠️ Anomaly detected in ' + data.anomalies.join(', '), 'error');
-                    }
-                });
-        }, 60000);
-
-        document.getElementById('theme-toggle').addEventListener('click', function() {
-            document.body.classList.toggle('dark-mode');
-        });
-    </script>
 </body>
 </html>
 '''
@@ -628,19 +486,19 @@ DASHBOARD_PAGE = '''
         const startDate = document.getElementById('start-date').value;
         const endDate = document.getElementById('end-date').value;
         const params = new URLSearchParams({farm, start_date: startDate, end_date: endDate, crops: selectedCrops.join(',')});
-        fetch('/api/dashboard-data?' + params).then(res=>res.json()).then(data => {
+        fetch('/api/page/dashboard/bootstrap?' + params).then(res=>res.json()).then(data => {
             document.querySelectorAll('.grid-4 .card .kpi-value')[0].textContent = data.kpi.total_yield;
             document.querySelectorAll('.grid-4 .card .kpi-value')[1].textContent = data.kpi.avg_temp;
             document.querySelectorAll('.grid-4 .card .kpi-value')[2].textContent = data.kpi.avg_soil_moisture;
             document.querySelectorAll('.grid-4 .card .kpi-value')[3].textContent = data.kpi.co2_footprint;
             document.getElementById('ai-message').textContent = data.ai_message;
-            Plotly.react('yield-chart', data.yield_chart.data, data.yield_chart.layout);
+            plotYield('yield-chart', data.yield_chart);
             Plotly.react('satellite-heatmap', [{z: data.satellite_data.z, x: data.satellite_data.x, y: data.satellite_data.y, type: 'heatmap', colorscale: 'Greens'}], {margin:{t:0,b:0,l:0,r:0}, height:300});
         });
     };
 
-    fetch('/api/chart-data').then(res=>res.json()).then(g=>Plotly.newPlot('yield-chart', g.data, g.layout));
-    Plotly.newPlot('satellite-heatmap', [{z:[[1,0.8,0.7,0.9],[0.7,0.9,0.8,0.6],[0.8,0.7,0.9,0.8],[0.9,0.8,0.7,0.9]], x:['Field A','Field B','Field C','Field D'], y:['Field A','Field B','Field C','Field D'], type:'heatmap', colorscale:'Greens'}], {margin:{t:0,b:0,l:0,r:0}, height:300});
+    // selectedCrops is declared by the deferred app.js, which has run by DOMContentLoaded
+    document.addEventListener('DOMContentLoaded', window.refreshPageData);
     document.getElementById('activate-valves').addEventListener('click', ()=>fetch('/api/activate-valves',{method:'POST'}).then(res=>res.json()).then(d=>alert(d.message)));
 </script>
 '''
@@ -655,17 +513,16 @@ ANALYTICS_PAGE = '''
     <div class="card"><h3>Anomaly Detection</h3><div id="anomaly-chart"></div></div>
 </div>
 <script>
+    const CLUSTER_TABLE_HEADER = '<table style="width:100%"><tr><th>Field</th><th>Cluster</th><th>Avg Temp</th><th>Avg Humidity</th><th>Soil Moisture</th><th>Yield</th></tr>';
     window.refreshPageData = function() {
         const params = new URLSearchParams({farm:document.getElementById('farm-select').value, crops:selectedCrops.join(',')});
-        fetch('/api/clustering-data?'+params).then(res=>res.json()).then(data => {
-            let html = '<table style="width:100%"><tr><th>Field</th><th>Cluster</th><th>Avg Temp</th><th>Avg Humidity</th><th>Soil Moisture</th><th>Yield</th></tr>';
-            data.forEach(f => html += `<tr><td>${f.field}</td><td>${f.cluster}</td><td>${f.temperature.toFixed(1)}°C</td><td>${f.humidity.toFixed(1)}%</td><td>${f.soil_moisture.toFixed(1)}%</td><td>${Math.round(f.crop_yield)} kg</td></tr>`);
-            html += '</table>';
-            document.getElementById('clustering-table').innerHTML = html;
+        fetch('/api/page/analytics/bootstrap?'+params).then(res=>res.json()).then(({clustering, anomaly_chart}) => {
+            const rows = clustering.map(f => `<tr><td>${f.field}</td><td>${f.cluster}</td><td>${f.temperature.toFixed(1)}°C</td><td>${f.humidity.toFixed(1)}%</td><td>${f.soil_moisture.toFixed(1)}%</td><td>${Math.round(f.crop_yield)} kg</td></tr>`).join('');
+            document.getElementById('clustering-table').innerHTML = CLUSTER_TABLE_HEADER + rows + '</table>';
+            plotAnomalies('anomaly-chart', anomaly_chart);
         });
-        fetch('/api/anomaly-chart-data?'+params).then(res=>res.json()).then(d=>Plotly.react('anomaly-chart', d.data, d.layout));
     };
-    window.refreshPageData();
+    document.addEventListener('DOMContentLoaded', window.refreshPageData);
 </script>
 '''
 
@@ -745,8 +602,7 @@ MAINTENANCE_PAGE = '''
 <script>
     fetch('/api/maintenance-data').then(res=>res.json()).then(data => {
         Plotly.newPlot('hours-chart', [{x:data.fields, y:data.hours, type:'bar', marker:{color:['#01B763','#ffb74d','#E74C3C','#01B763']}}], {title:'Equipment Hours'});
-        let alerts = '';
-        data.maintenance.forEach((m,i) => alerts += `<div style="padding:0.5rem; background:${m.status=='Due soon'?'#ffebee':'#e8f5e9'}; border-radius:8px; margin:0.5rem 0;">${data.fields[i]}: ${m.hours} hrs - ${m.status}</div>`);
+        const alerts = data.maintenance.map((m,i) => `<div style="padding:0.5rem; background:${m.status=='Due soon'?'#ffebee':'#e8f5e9'}; border-radius:8px; margin:0.5rem 0;">${data.fields[i]}: ${m.hours} hrs - ${m.status}</div>`).join('');
         document.getElementById('maintenance-alerts').innerHTML = alerts;
     });
 </script>
@@ -822,193 +678,342 @@ SETTINGS_PAGE = '''
 </script>
 '''
 
+# -------------------- Compiled Templates --------------------
+# Parsed once at import; the base uses the app environment so `request` and `url_for` resolve
+_BASE_TMPL = app.jinja_env.from_string(BASE_TEMPLATE)
+_PAGE_TMPLS = {
+    'dashboard': Template(DASHBOARD_PAGE),
+    'analytics': Template(ANALYTICS_PAGE),
+    'crop_health': Template(CROP_HEALTH_PAGE),
+    'irrigation': Template(IRRIGATION_PAGE),
+    'forecasting': Template(FORECASTING_PAGE),
+    'maintenance': Template(MAINTENANCE_PAGE),
+    'carbon': Template(CARBON_PAGE),
+    'energy': Template(ENERGY_PAGE),
+    'settings': Template(SETTINGS_PAGE),
+}
+
+@lru_cache(maxsize=32)
+def render_static_page(name, day):
+    # Pages without per-request data only show today's date, so render each at most once a day
+    globals = inject_globals()
+    page_html = _PAGE_TMPLS[name].render(**globals)
+    return _BASE_TMPL.render(page_content=page_html, **globals)
+
+def current_day():
+    return date.today().isoformat()
+
 # -------------------- Routes --------------------
 @app.route('/')
 def dashboard():
     kpi = get_kpi_data()
     ai_message = get_ai_recommendation()
     globals = inject_globals()
-    page_html = Template(DASHBOARD_PAGE).render(kpi=kpi, ai_message=ai_message, **globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    page_html = _PAGE_TMPLS['dashboard'].render(kpi=kpi, ai_message=ai_message, **globals)
+    return _BASE_TMPL.render(page_content=page_html, **globals)
 
 @app.route('/analytics')
 def analytics():
-    globals = inject_globals()
-    page_html = Template(ANALYTICS_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('analytics', current_day())
 
 @app.route('/crop-health')
 def crop_health():
-    globals = inject_globals()
-    page_html = Template(CROP_HEALTH_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('crop_health', current_day())
 
 @app.route('/irrigation')
 def irrigation():
-    globals = inject_globals()
-    page_html = Template(IRRIGATION_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('irrigation', current_day())
 
 @app.route('/forecasting')
 def forecasting():
     forecast = forecast_yield()
     globals = inject_globals()
-    page_html = Template(FORECASTING_PAGE).render(forecast=forecast, **globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    page_html = _PAGE_TMPLS['forecasting'].render(forecast=forecast, **globals)
+    return _BASE_TMPL.render(page_content=page_html, **globals)
 
 @app.route('/maintenance')
 def maintenance():
-    globals = inject_globals()
-    page_html = Template(MAINTENANCE_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('maintenance', current_day())
 
 @app.route('/carbon')
 def carbon():
-    globals = inject_globals()
-    page_html = Template(CARBON_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('carbon', current_day())
 
 @app.route('/energy')
 def energy():
-    globals = inject_globals()
-    page_html = Template(ENERGY_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('energy', current_day())
 
 @app.route('/settings')
 def settings():
-    globals = inject_globals()
-    page_html = Template(SETTINGS_PAGE).render(**globals)
-    return render_template_string(BASE_TEMPLATE, page_content=page_html)
+    return render_static_page('settings', current_day())
+
+# -------------------- Response Caching --------------------
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def ojsonify(obj):
+    return app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
+def body_etag(body):
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+def conditional_response(body, etag=None, mimetype='application/json', max_age=None):
+    # Weak ETag: one validator covers the identity, br and gzip variants of the same body.
+    # Without max_age the client revalidates every time and gets an empty 304 if unchanged.
+    response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(etag or body_etag(body), weak=True)
+    if max_age:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+def cached_response(ttl, maxsize=64, jitter=0):
+    # Cache a GET endpoint's body per path and query string for `ttl` seconds, plus up to
+    # `jitter` more per entry so entries filled together do not all expire together
+    if jitter:
+        cache = TLRUCache(maxsize=maxsize, ttu=lambda key, value, now: now + ttl + _RNG.uniform(0, jitter))
+    else:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    lock = threading.Lock()
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (request.path, tuple(sorted(request.args.items(multi=True))))
+            with lock:
+                hit = cache.get(key)
+            if hit is None:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body = response.get_data()
+                hit = (body, response.mimetype, body_etag(body))
+                with lock:
+                    cache[key] = hit
+            body, mimetype, etag = hit
+            return conditional_response(body, etag, mimetype)
+        return wrapper
+    return decorator
 
 # -------------------- API Endpoints --------------------
-@app.route('/api/dashboard-data')
-def dashboard_data():
-    farm = request.args.get('farm', 'Green Valley Farm')
-    crops = request.args.get('crops', '').split(',') if request.args.get('crops') else []
-    filters = {'farm': farm, 'crops': crops}
-    kpi = get_kpi_data(filters)
-    ai_message = get_ai_recommendation()
+# Simulated telemetry is polled on timers; every poll inside the window gets the same reading
+TELEMETRY_TTL = 30
+TELEMETRY_JITTER = 30
+
+def request_filters(default_farm='Green Valley Farm'):
+    # (farm, sorted crop tuple): one normalized key, so every endpoint hits the same cache entries
+    farm = request.args.get('farm', default_farm)
+    crops = request.args.get('crops', '')
+    return farm, tuple(sorted(crops.split(','))) if crops else ()
+
+SATELLITE_DATA = {
+    'z': [[1, 0.8, 0.7, 0.9], [0.7, 0.9, 0.8, 0.6], [0.8, 0.7, 0.9, 0.8], [0.9, 0.8, 0.7, 0.9]],
+    'x': ['Field A', 'Field B', 'Field C', 'Field D'],
+    'y': ['Field A', 'Field B', 'Field C', 'Field D']
+}
+
+def dashboard_bootstrap(farm, crops):
+    filters = {'farm': farm, 'crops': list(crops)}
     df = generate_sample_data(**filters)
-    fig = px.line(df, x='date', y='crop_yield', color='field', title='Yield Over Time')
-    yield_chart = json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder))
-    satellite_data = {
-        'z': [[1, 0.8, 0.7, 0.9], [0.7, 0.9, 0.8, 0.6], [0.8, 0.7, 0.9, 0.8], [0.9, 0.8, 0.7, 0.9]],
-        'x': ['Field A', 'Field B', 'Field C', 'Field D'],
-        'y': ['Field A', 'Field B', 'Field C', 'Field D']
-    }
-    return jsonify({'kpi': kpi, 'ai_message': ai_message, 'yield_chart': yield_chart, 'satellite_data': satellite_data})
+    return {'kpi': get_kpi_data(filters), 'ai_message': get_ai_recommendation(),
+            'yield_chart': yield_series(df), 'satellite_data': SATELLITE_DATA}
+
+CLUSTER_FEATURES = ['temperature', 'humidity', 'soil_moisture', 'crop_yield']
+
+def standardize(X):
+    # Column z-scores; constant columns are left centred rather than divided by zero
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    return (X - X.mean(axis=0)) / std
+
+def kmeans_labels(X, n_clusters=3, max_iter=10, seed=42):
+    # Plain Lloyd iterations; the handful of field rows makes sklearn's setup the dominant cost
+    n_clusters = min(n_clusters, len(X))
+    rng = np.random.default_rng(seed)
+    centers = X[rng.choice(len(X), n_clusters, replace=False)]
+    labels = np.zeros(len(X), dtype=np.intp)
+    for _ in range(max_iter):
+        labels = ((X[:, None, :] - centers[None, :, :]) ** 2).sum(axis=-1).argmin(axis=1)
+        new_centers = np.array([X[labels == k].mean(axis=0) if (labels == k).any() else centers[k]
+                                for k in range(n_clusters)])
+        if np.allclose(new_centers, centers):
+            break
+        centers = new_centers
+    return labels
+
+@lru_cache(maxsize=32)
+def _cluster(version, farm, crops_tuple):
+    # Same reduceat kernel as the anomaly features, so no pandas groupby on this path
+    # Read at the keyed version, so a concurrent reload_data() cannot cache new data under the old key
+    cols = _sample_columns(version, farm, None, None, frozenset(crops_tuple) or None)
+    fields, means = field_means(cols, CLUSTER_FEATURES)
+    if not len(means):
+        # Nothing matched the filters
+        return []
+    labels = kmeans_labels(standardize(means))
+    return [{'field': field, **dict(zip(CLUSTER_FEATURES, row)), 'cluster': label}
+            for field, row, label in zip(fields.tolist(), means.tolist(), labels.tolist())]
 
 @app.route('/api/clustering-data')
 def clustering_data():
-    farm = request.args.get('farm', 'Green Valley Farm')
-    crops = request.args.get('crops', '').split(',') if request.args.get('crops') else []
-    filters = {'farm': farm, 'crops': crops}
-    df = generate_sample_data(**filters).groupby('field').agg({
-        'temperature': 'mean', 'humidity': 'mean', 'soil_moisture': 'mean', 'crop_yield': 'mean'
-    }).reset_index()
-    features = df[['temperature', 'humidity', 'soil_moisture', 'crop_yield']]
-    scaler = StandardScaler()
-    scaled = scaler.fit_transform(features)
-    kmeans = KMeans(n_clusters=3, random_state=42)
-    df['cluster'] = kmeans.fit_predict(scaled)
-    return jsonify(df.to_dict(orient='records'))
+    farm, crops = request_filters()
+    return conditional_response(orjson.dumps(_cluster(_DATA_VERSION, farm, crops), option=ORJSON_OPTIONS))
+
+def anomaly_scores():
+    # Drawn by plotAnomalies() in static/app.js
+    return {'fields': ['Field A', 'Field B', 'Field C', 'Field D'], 'scores': _RNG.uniform(-0.5, 0.5, 4).tolist()}
 
 @app.route('/api/anomaly-chart-data')
+@cached_response(TELEMETRY_TTL, jitter=TELEMETRY_JITTER)
 def anomaly_chart_data():
-    fields = ['Field A', 'Field B', 'Field C', 'Field D']
-    scores = np.random.uniform(-0.5, 0.5, 4).tolist()
-    fig = go.Figure(data=[go.Bar(x=fields, y=scores, marker_color=['red' if s>0.2 else 'green' for s in scores])])
-    fig.update_layout(title='Anomaly Scores')
-    return jsonify(json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)))
+    return ojsonify(anomaly_scores())
+
+def analytics_bootstrap(farm, crops):
+    return {'clustering': _cluster(_DATA_VERSION, farm, crops), 'anomaly_chart': anomaly_scores()}
+
+# Everything a page draws on load, in one response instead of one fetch per panel
+PAGE_BOOTSTRAPS = {'dashboard': dashboard_bootstrap, 'analytics': analytics_bootstrap}
+
+# Serialized payloads with their ETag, keyed on page and normalized filters; the one cache
+# behind both the bootstrap endpoint and /api/dashboard-data, so they never disagree
+_page_payload_cache = TTLCache(maxsize=64, ttl=60)
+
+@cached(_page_payload_cache, lock=threading.Lock())
+def page_payload(name, farm, crops):
+    payload = orjson.dumps(PAGE_BOOTSTRAPS[name](farm, crops), option=ORJSON_OPTIONS)
+    return payload, body_etag(payload)
+
+@app.route('/api/page/<name>/bootstrap')
+def page_bootstrap(name):
+    if name not in PAGE_BOOTSTRAPS:
+        abort(404)
+    return conditional_response(*page_payload(name, *request_filters()))
+
+@app.route('/api/dashboard-data')
+def dashboard_data():
+    return conditional_response(*page_payload('dashboard', *request_filters()))
+
+# Hard-coded chart payloads, encoded once; clients may keep them for a day
+CONSTANT_MAX_AGE = 86400
+
+_NDVI_BYTES = orjson.dumps({'fields': ['Field A','Field B','Field C','Field D'], 'ndvi': [0.82,0.75,0.68,0.79], 'colors': ['#01B763','#ffb74d','#E74C3C','#66bb6a']})
+_NDVI_ETAG = body_etag(_NDVI_BYTES)
 
 @app.route('/api/ndvi-data')
 def ndvi_data():
-    return jsonify({'fields': ['Field A','Field B','Field C','Field D'], 'ndvi': [0.82,0.75,0.68,0.79], 'colors': ['#01B763','#ffb74d','#E74C3C','#66bb6a']})
+    return conditional_response(_NDVI_BYTES, _NDVI_ETAG, max_age=CONSTANT_MAX_AGE)
+
+_RADAR_BYTES = orjson.dumps({'metrics': ['NDVI','Pest','Disease','Water','Nutrient'], 'values': [0.8,0.6,0.3,0.4,0.7]})
+_RADAR_ETAG = body_etag(_RADAR_BYTES)
 
 @app.route('/api/radar-data')
 def radar_data():
-    return jsonify({'metrics': ['NDVI','Pest','Disease','Water','Nutrient'], 'values': [0.8,0.6,0.3,0.4,0.7]})
+    return conditional_response(_RADAR_BYTES, _RADAR_ETAG, max_age=CONSTANT_MAX_AGE)
+
+_WATER_USAGE_BYTES = orjson.dumps({'days': ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'], 'usage': [120,135,110,145,130,155,140]})
+_WATER_USAGE_ETAG = body_etag(_WATER_USAGE_BYTES)
 
 @app.route('/api/water-usage')
 def water_usage():
-    return jsonify({'days': ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'], 'usage': [120,135,110,145,130,155,140]})
+    return conditional_response(_WATER_USAGE_BYTES, _WATER_USAGE_ETAG, max_age=CONSTANT_MAX_AGE)
 
 @app.route('/api/gauge-data')
+@cached_response(TELEMETRY_TTL, jitter=TELEMETRY_JITTER)
 def gauge_data():
-    return jsonify({'soil_moisture': np.random.randint(60,85)})
+    return ojsonify({'soil_moisture': int(_RNG.integers(60,85))})
+
+_WEATHER_FORECAST_BYTES = orjson.dumps({'days': ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'], 'temp': [23,25,22,21,24,26,27]})
+_WEATHER_FORECAST_ETAG = body_etag(_WEATHER_FORECAST_BYTES)
 
 @app.route('/api/weather-forecast')
 def weather_forecast():
-    return jsonify({'days': ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'], 'temp': [23,25,22,21,24,26,27]})
+    return conditional_response(_WEATHER_FORECAST_BYTES, _WEATHER_FORECAST_ETAG, max_age=CONSTANT_MAX_AGE)
 
 @app.route('/api/forecast-data')
+@cached_response(60)
 def forecast_data():
-    forecast = forecast_yield()
-    page = int(request.args.get('page', 1))
-    if page > 1:
-        forecast = [f * (1 + (page-1)*0.05) for f in forecast]
-    days = ['Day '+str(i+1+(page-1)*30) for i in range(30)]
-    return jsonify({'days': days, 'forecast': forecast})
+    # Non-integer pages fall back to 1 and pages start at 1, before anything is cached
+    page = max(1, request.args.get('page', 1, type=int))
+    forecast = _base_forecast(_DATA_VERSION, FORECAST_DAYS) * (1 + (page-1)*0.05)
+    return ojsonify({'days': forecast_day_labels(page), 'forecast': forecast})
+
+_PRICE_PREDICTION_BYTES = orjson.dumps({'dates': ['Week1','Week2','Week3','Week4'], 'prices': [4.85,4.92,5.01,5.10]})
+_PRICE_PREDICTION_ETAG = body_etag(_PRICE_PREDICTION_BYTES)
 
 @app.route('/api/price-prediction')
 def price_prediction():
-    return jsonify({'dates': ['Week1','Week2','Week3','Week4'], 'prices': [4.85,4.92,5.01,5.10]})
+    return conditional_response(_PRICE_PREDICTION_BYTES, _PRICE_PREDICTION_ETAG, max_age=CONSTANT_MAX_AGE)
+
+_WEATHER_IMPACT_BYTES = orjson.dumps({'temp': [20,22,24,26,28,30], 'yield': [1100,1200,1300,1250,1150,1000]})
+_WEATHER_IMPACT_ETAG = body_etag(_WEATHER_IMPACT_BYTES)
 
 @app.route('/api/weather-impact')
 def weather_impact():
-    return jsonify({'temp': [20,22,24,26,28,30], 'yield': [1100,1200,1300,1250,1150,1000]})
+    return conditional_response(_WEATHER_IMPACT_BYTES, _WEATHER_IMPACT_ETAG, max_age=CONSTANT_MAX_AGE)
 
 @app.route('/api/chart-data')
+@cached_response(300)
 def chart_data():
-    df = generate_sample_data()
-    fig = px.line(df, x='date', y='crop_yield', color='field', title='Yield Over Time')
-    return jsonify(json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)))
+    # Unfiltered unless the caller passes farm/crops, as before
+    farm, crops = request_filters(default_farm=None)
+    df = generate_sample_data(farm=farm, crops=list(crops))
+    return ojsonify(yield_series(df))
 
 @app.route('/api/sensor-data')
+@cached_response(TELEMETRY_TTL, jitter=TELEMETRY_JITTER)
 def sensor_data():
-    return jsonify({
-        'soil_moisture': round(np.random.uniform(60,85),1),
-        'temperature': round(np.random.uniform(18,32),1),
-        'humidity': round(np.random.uniform(50,80),1),
-        'light': np.random.randint(800,1000)
+    soil_moisture, temperature, humidity, light = _RNG.uniform([60,18,50,800], [85,32,80,1000]).tolist()
+    return ojsonify({
+        'soil_moisture': round(soil_moisture,1),
+        'temperature': round(temperature,1),
+        'humidity': round(humidity,1),
+        'light': int(light)
     })
 
 @app.route('/api/anomalies')
 def anomalies():
-    return jsonify({'anomalies': detect_anomalies()})
+    return ojsonify({'anomalies': detect_anomalies()})
 
 @app.route('/api/maintenance-data')
+@cached_response(TELEMETRY_TTL, jitter=TELEMETRY_JITTER)
 def maintenance_data():
     data = predict_maintenance()
     fields = list(data.keys())
     hours = [data[f][0] for f in fields]
     status = [data[f][1] for f in fields]
-    return jsonify({'fields': fields, 'hours': hours, 'maintenance': [{'hours':h, 'status':s} for h,s in zip(hours,status)]})
+    return ojsonify({'fields': fields, 'hours': hours, 'maintenance': [{'hours':h, 'status':s} for h,s in zip(hours,status)]})
 
 @app.route('/api/carbon-data')
+@cached_response(TELEMETRY_TTL, jitter=TELEMETRY_JITTER)
 def carbon_data():
-    return jsonify({
+    return ojsonify({
         'fields': ['Field A','Field B','Field C','Field D'],
-        'emissions': [round(np.random.uniform(15,30),1) for _ in range(4)],
-        'offset': np.random.randint(40,80)
+        'emissions': _RNG.uniform(15,30,4).round(1).tolist(),
+        'offset': int(_RNG.integers(40,80))
     })
 
 @app.route('/api/activate-valves', methods=['POST'])
 def activate_valves():
-    return jsonify({'message': 'All valves activated successfully!'})
+    return ojsonify({'message': 'All valves activated successfully!'})
 
 @app.route('/api/toggle-valve', methods=['POST'])
 def toggle_valve():
     data = request.json
     field = data.get('field')
-    return jsonify({'message': f'Valve for Field {field} toggled.'})
+    return ojsonify({'message': f'Valve for Field {field} toggled.'})
 
 @app.route('/api/save-settings', methods=['POST'])
 def save_settings():
     settings = request.json
     print("Settings saved:", settings)
-    return jsonify({'message': 'Settings saved successfully!'})
+    return ojsonify({'message': 'Settings saved successfully!'})
 
+# Development server only. Deploy behind a WSGI server, e.g.
+#   gunicorn -k gthread -w 2 --threads 8 assign-2:app
+# Caches are in-process, so each gunicorn worker warms its own copy.
 if __name__ == '__main__':
-    print(f"Using {'REAL' if REAL_DATA_AVAILABLE else 'SYNTHETIC'} data.")
-    app.run(debug=True, host='127.0.0.1', port=5000)
+    if not REAL_DATA_AVAILABLE and os.path.exists(DATA_FILE):
+        print(f"{DATA_FILE} found but could not be loaded (see log above); using SYNTHETIC data.")
+    else:
+        print(f"Using {'REAL' if REAL_DATA_AVAILABLE else 'SYNTHETIC'} data.")
+    app.run(debug=True, host='127.0.0.1', port=5000, threaded=True)
@@ -0,0 +1,117 @@
+let selectedCrops = ['Corn', 'Wheat'];
+document.querySelectorAll('.chip').forEach(chip => {
+    const crop = chip.dataset.crop;
+    if (selectedCrops.includes(crop)) chip.classList.add('selected');
+    chip.addEventListener('click', function() {
+        const crop = this.dataset.crop;
+        if (selectedCrops.includes(crop)) {
+            selectedCrops = selectedCrops.filter(c => c !== crop);
+            this.classList.remove('selected');
+        } else {
+            selectedCrops.push(crop);
+            this.classList.add('selected');
+        }
+        if (window.refreshPageData) window.refreshPageData();
+    });
+});
+
+// Pages are cached server-side for the day, so the load time is stamped by the client
+document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
+
+document.getElementById('refresh-btn').addEventListener('click', function() {
+    showSpinner();
+    if (window.refreshPageData) window.refreshPageData();
+    document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
+    hideSpinner();
+});
+
+document.getElementById('farm-select').addEventListener('change', function() {
+    if (window.refreshPageData) window.refreshPageData();
+});
+document.getElementById('start-date').addEventListener('change', function() {
+    if (window.refreshPageData) window.refreshPageData();
+});
+document.getElementById('end-date').addEventListener('change', function() {
+    if (window.refreshPageData) window.refreshPageData();
+});
+
+function showSpinner() {
+    let spinner = document.getElementById('global-spinner');
+    if (!spinner) {
+        spinner = document.createElement('div');
+        spinner.id = 'global-spinner';
+        spinner.className = 'spinner';
+        spinner.style.position = 'fixed';
+        spinner.style.top = '50%';
+        spinner.style.left = '50%';
+        spinner.style.transform = 'translate(-50%, -50%)';
+        spinner.style.zIndex = '3000';
+        document.body.appendChild(spinner);
+    }
+}
+function hideSpinner() {
+    const spinner = document.getElementById('global-spinner');
+    if (spinner) spinner.remove();
+}
+
+// Chart endpoints send bare arrays; the figure spec lives here
+function plotYield(el, series) {
+    const traces = series.traces.map(t => ({...t, type: 'scattergl', mode: 'lines'}));
+    Plotly.react(el, traces, {title: {text: 'Yield Over Time'}, legend: {title: {text: 'field'}},
+        xaxis: {title: {text: 'date'}}, yaxis: {title: {text: 'crop_yield'}}});
+}
+function plotAnomalies(el, anomalies) {
+    const colors = anomalies.scores.map(s => s > 0.2 ? 'red' : 'green');
+    Plotly.react(el, [{type: 'bar', x: anomalies.fields, y: anomalies.scores, marker: {color: colors}}],
+        {title: {text: 'Anomaly Scores'}});
+}
+
+function showNotification(message, type = 'info') {
+    const area = document.getElementById('notification-area');
+    const notif = document.createElement('div');
+    notif.className = 'notification';
+    notif.style.borderLeftColor = type === 'error' ? '#E74C3C' : '#01B763';
+    notif.innerHTML = message;
+    area.appendChild(notif);
+    setTimeout(() => notif.remove(), 5000);
+}
+
+function updateSensors() {
+    fetch('/api/sensor-data')
+        .then(res => res.json())
+        .then(data => {
+            document.querySelectorAll('.sensor-value').forEach(el => {
+                const sensor = el.dataset.sensor;
+                if (data[sensor] !== undefined) {
+                    let unit = '';
+                    if (sensor === 'temperature') unit = '°C';
+                    else if (sensor === 'humidity') unit = '%';
+                    else if (sensor === 'light') unit = ' lux';
+                    else unit = '%';
+                    el.textContent = data[sensor] + unit;
+                    const progress = el.closest('.sensor-item')?.querySelector('.progress');
+                    if (progress) {
+                        let percent = data[sensor];
+                        if (sensor === 'temperature') percent = (data[sensor] / 50) * 100;
+                        if (sensor === 'light') percent = (data[sensor] / 1000) * 100;
+                        progress.style.width = Math.min(percent, 100) + '%';
+                    }
+                }
+            });
+        });
+}
+setInterval(updateSensors, 30000);
+
+setInterval(() => {
+    fetch('/api/anomalies')
+        .then(res => res.json())
+        .then(data => {
+            if (data.anomalies.length > 0) {
+                showNotification('⚠️ Anomaly detected in ' + data.anomalies.join(', '), 'error');
+            }
+        });
+}, 60000);
+
+document.getElementById('theme-toggle').addEventListener('click', function() {
+    document.body.classList.toggle('dark-mode');
+});